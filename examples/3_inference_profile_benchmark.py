@@ -0,0 +1,25 @@
+# examples/3_inference_profile_benchmark.py
+import argparse
+from pedestrian_intent.core.profiles import INFERENCE_PROFILES
+from pedestrian_intent.utils.benchmark import benchmark_profiles, format_report
+
+def main():
+    parser = argparse.ArgumentParser(description="Accuracy-vs-speed report for the inference profiles.")
+    parser.add_argument("--profiles", nargs="+", default=list(INFERENCE_PROFILES),
+                        help="Profiles to compare; the first one is the accuracy reference.")
+    parser.add_argument("--frames", type=int, default=30, help="Number of synthetic frames.")
+    parser.add_argument("--output", default=None, help="Optional path to save the Markdown report.")
+    args = parser.parse_args()
+
+    print(f"Benchmarking profiles {args.profiles} on {args.frames} synthetic frames...")
+    results = benchmark_profiles(args.profiles, num_frames=args.frames)
+    report = format_report(results)
+    print(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + "\n")
+        print(f"Report saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
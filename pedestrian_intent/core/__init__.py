@@ -1,2 +1,3 @@
 # pedestrian_intent/core/__init__.py
-from .structures import DetectedObject, Pedestrian, FrameData
\ No newline at end of file
+from .structures import DetectedObject, Pedestrian, FrameData
+from .profiles import ModelProfile, InferenceProfile, INFERENCE_PROFILES, get_profile
\ No newline at end of file
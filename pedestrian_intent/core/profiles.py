@@ -0,0 +1,128 @@
+# pedestrian_intent/core/profiles.py
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Union
+import cv2
+
+# ONNX export is not wired into the model loaders yet, so it is not offered here
+PRECISIONS = ("fp32", "fp16", "int8")
+
+@dataclass
+class ModelProfile:
+    """Inference settings for a single model."""
+    input_scale: float = 1.0   # Resize factor applied to the model input, outputs are mapped back
+    precision: str = "fp32"    # One of PRECISIONS
+
+    def __post_init__(self):
+        if not 0.0 < self.input_scale <= 1.0:
+            raise ValueError(f"input_scale must be in (0, 1], got {self.input_scale}")
+        if self.precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {PRECISIONS}, got '{self.precision}'")
+
+
+@dataclass
+class InferenceProfile:
+    """
+    Groups the device and per-model settings used to build the pipeline.
+    The gaze model only honours `precision`; its input_scale must stay 1.0.
+
+    `num_threads` is a single value for the whole pipeline: OpenCV and PyTorch
+    thread pools are process-wide, so it cannot differ between models.
+    """
+    name: str
+    device: str = "cuda"
+    num_threads: Optional[int] = None  # CPU threads, None keeps the library default
+    detector: ModelProfile = field(default_factory=ModelProfile)
+    pose: ModelProfile = field(default_factory=ModelProfile)
+    gaze: ModelProfile = field(default_factory=ModelProfile)
+
+
+INFERENCE_PROFILES: Dict[str, InferenceProfile] = {
+    "default": InferenceProfile(name="default"),
+    "cpu": InferenceProfile(
+        name="cpu",
+        device="cpu",
+        num_threads=4,
+        detector=ModelProfile(input_scale=0.75, precision="int8"),
+        pose=ModelProfile(input_scale=0.75, precision="int8"),
+        gaze=ModelProfile(precision="int8"),
+    ),
+    "cpu_edge": InferenceProfile(
+        name="cpu_edge",
+        device="cpu",
+        num_threads=2,
+        detector=ModelProfile(input_scale=0.5, precision="int8"),
+        pose=ModelProfile(input_scale=0.5, precision="int8"),
+        gaze=ModelProfile(precision="int8"),
+    ),
+}
+
+
+def get_profile(profile: Union[str, InferenceProfile, None] = None) -> InferenceProfile:
+    """Resolves a profile name (or None for 'default') to an InferenceProfile."""
+    if profile is None:
+        profile = "default"
+    if isinstance(profile, InferenceProfile):
+        return profile
+    if profile not in INFERENCE_PROFILES:
+        raise ValueError(f"Unknown inference profile '{profile}'. Available: {list(INFERENCE_PROFILES)}")
+    return INFERENCE_PROFILES[profile]
+
+
+def set_num_threads(num_threads: Optional[int]):
+    """Sets the CPU thread count used by OpenCV and, if installed, PyTorch."""
+    if num_threads is None:
+        return
+    cv2.setNumThreads(num_threads)
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+
+
+class _HalfPrecisionModel:
+    """Calls an fp16 model with its floating-point tensor inputs converted to half precision."""
+    def __init__(self, model):
+        self.model = model.half()
+
+    def _to_half(self, value):
+        import torch
+        if isinstance(value, torch.Tensor) and value.is_floating_point():
+            return value.half()
+        return value
+
+    def __call__(self, *args, **kwargs):
+        args = [self._to_half(a) for a in args]
+        kwargs = {k: self._to_half(v) for k, v in kwargs.items()}
+        return self.model(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
+
+
+def apply_precision(model, model_profile: ModelProfile, device: str):
+    """
+    Converts a loaded model to the numeric precision requested by the profile.
+
+    Only torch.nn.Module instances are converted; anything else (e.g. the mock
+    models) is returned unchanged. The result is called like the original model.
+    """
+    try:
+        import torch
+    except ImportError:
+        return model
+    if not isinstance(model, torch.nn.Module) or model_profile.precision == "fp32":
+        return model
+
+    model.eval()
+    if model_profile.precision == "fp16":
+        if device == "cpu":
+            print("  - fp16 inference is GPU-only, keeping fp32.")
+            return model
+        return _HalfPrecisionModel(model)
+    if model_profile.precision == "int8":
+        if device != "cpu":
+            print("  - int8 dynamic quantization is CPU-only, keeping fp32.")
+            return model
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
@@ -30,6 +30,7 @@ class Pedestrian(DetectedObject):
     keypoints: Optional[np.ndarray] = None  # Shape (N, 3) for (x, y, conf)
     gaze_vector: Optional[np.ndarray] = None # Shape (2,) for (pitch, yaw)
     head_bbox: Optional[np.ndarray] = None # Bbox for the head
+    gaze_staleness: Optional[int] = None # Frames since gaze_vector was last estimated by the model
     
     # This will be populated by the TrajectoryExtractor
     trajectory: List[np.ndarray] = field(default_factory=list)
@@ -62,4 +63,5 @@ class VideoData:
                 existing_ped.keypoints = ped.keypoints
                 existing_ped.gaze_vector = ped.gaze_vector
                 existing_ped.head_bbox = ped.head_bbox
+                existing_ped.gaze_staleness = ped.gaze_staleness
                 existing_ped.trajectory.append(ped.centroid)
\ No newline at end of file
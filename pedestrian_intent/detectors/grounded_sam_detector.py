@@ -1,7 +1,9 @@
 # pedestrian_intent/detectors/grounded_sam_detector.py
+import cv2
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 from ..core.structures import DetectedObject, Pedestrian
+from ..core.profiles import ModelProfile, apply_precision
 
 class GroundedSAMDetector:
     """
@@ -10,10 +12,14 @@ class GroundedSAMDetector:
     NOTE: This is a high-level abstraction. A real implementation would require loading
     the actual models from HuggingFace Transformers, official repositories, etc.,
     and writing the inference logic.
+
+    An optional ModelProfile downscales the frame before detection (boxes and
+    masks are mapped back to frame coordinates) and sets the precision.
     """
-    def __init__(self, device: str = 'cuda'):
+    def __init__(self, device: str = 'cuda', profile: Optional[ModelProfile] = None):
         print("Initializing GroundedSAMDetector...")
         self.device = device
+        self.profile = profile or ModelProfile()
         self._load_models()
         # In a real scenario, SAM2 would maintain a tracker state
         self.tracker_state = {} 
@@ -28,6 +34,8 @@ class GroundedSAMDetector:
         self.grounding_dino = "(Mock GroundingDINO Model)"
         print("  - Placeholder: Loading SAM2 video tracker model...")
         self.sam2_tracker = "(Mock SAM2 Tracker Model)"
+        self.grounding_dino = apply_precision(self.grounding_dino, self.profile, self.device)
+        self.sam2_tracker = apply_precision(self.sam2_tracker, self.profile, self.device)
         print("Models loaded.")
 
     def process_frame(self, image: np.ndarray, text_prompts: List[str]) -> (List[Pedestrian], List[DetectedObject]):
@@ -43,6 +51,12 @@ class GroundedSAMDetector:
         """
         # This is a mock implementation. A real one would call the models.
         print(f"  - Detecting and segmenting with prompts: {text_prompts}")
+
+        frame_h, frame_w = image.shape[:2]
+        scale = self.profile.input_scale
+        if scale < 1.0:
+            image = cv2.resize(image, (max(int(round(frame_w * scale)), 1), max(int(round(frame_h * scale)), 1)),
+                               interpolation=cv2.INTER_LINEAR)
         
         # --- MOCK LOGIC START ---
         # Simulate detecting one pedestrian and one car
@@ -79,6 +93,9 @@ class GroundedSAMDetector:
             })
         # --- MOCK LOGIC END ---
 
+        if scale < 1.0:
+            mock_results = [self._to_frame_coordinates(res, (h, w), (frame_h, frame_w)) for res in mock_results]
+
         pedestrians = []
         scene_elements = []
 
@@ -95,4 +112,29 @@ class GroundedSAMDetector:
             else:
                 scene_elements.append(DetectedObject(**common_args))
 
-        return pedestrians, scene_elements
\ No newline at end of file
+        return pedestrians, scene_elements
+
+    def _to_frame_coordinates(self, result: Dict, input_shape: tuple, frame_shape: tuple) -> Dict:
+        """Maps the bbox and mask of a detection made on a downscaled input back to the full frame."""
+        (h, w), (frame_h, frame_w) = input_shape, frame_shape
+        sx, sy = frame_w / w, frame_h / h
+        bbox = result["bbox"]
+        scaled_bbox = bbox * np.array([sx, sy, sx, sy])
+        # Keep the dtype of the unscaled path so profiles don't change the API
+        if np.issubdtype(bbox.dtype, np.integer):
+            scaled_bbox = np.round(scaled_bbox)
+        result["bbox"] = scaled_bbox.astype(bbox.dtype)
+
+        # Only upscale the occupied region of the mask instead of the whole frame
+        mask = result["mask"]
+        full_mask = np.zeros((frame_h, frame_w), dtype=bool)
+        rows, cols = np.flatnonzero(mask.any(axis=1)), np.flatnonzero(mask.any(axis=0))
+        if rows.size > 0:
+            r1, r2, c1, c2 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+            fr1, fr2 = int(round(r1 * sy)), min(int(round(r2 * sy)), frame_h)
+            fc1, fc2 = int(round(c1 * sx)), min(int(round(c2 * sx)), frame_w)
+            region = cv2.resize(mask[r1:r2, c1:c2].astype(np.uint8), (fc2 - fc1, fr2 - fr1),
+                                interpolation=cv2.INTER_NEAREST)
+            full_mask[fr1:fr2, fc1:fc2] = region.astype(bool)
+        result["mask"] = full_mask
+        return result
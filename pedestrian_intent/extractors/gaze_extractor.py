@@ -1,50 +1,164 @@
 # pedestrian_intent/extractors/gaze_extractor.py
 import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Optional
 from .base_extractor import BaseExtractor
 from ..core.structures import Pedestrian, FrameData
+from ..core.profiles import ModelProfile, apply_precision
 import cv2
 
+@dataclass
+class _GazeTrackState:
+    """Per-track memory used by the track-aware mode of GazeExtractor."""
+    head_crop: np.ndarray       # Small grayscale thumbnail of the last model input
+    head_bbox: np.ndarray       # Head bbox at the last model run
+    gaze_vector: np.ndarray     # Smoothed (pitch, yaw)
+    last_frame_id: int          # Last frame this track was seen in
+    staleness: int = 0          # Frames since the model last ran for this track
+    change_score: float = 0.0   # Head change score against the last model input
+
+
 class GazeExtractor(BaseExtractor):
     """
     Extracts gaze direction using a pre-trained model like ETH-XGaze.
-    
+
+    With `track_aware=True`, the extractor keeps the last head crop and gaze
+    estimate per track_id and only re-runs the model when the head region has
+    changed beyond `change_threshold` or the estimate is older than `max_age`
+    frames. In between, the exponentially smoothed estimate is reused and
+    `Pedestrian.gaze_staleness` reports how many frames old it is.
+
+    An optional ModelProfile sets the model precision. The gaze model takes a
+    fixed-size head crop, so `input_scale` is not supported and must stay 1.0.
+
     NOTE: This is a high-level abstraction.
     """
-    def __init__(self, device: str = 'cuda'):
+    THUMBNAIL_SIZE = (32, 32)
+
+    def __init__(self, device: str = 'cuda', track_aware: bool = False,
+                 change_threshold: float = 0.15, max_age: int = 10, smoothing: float = 0.6,
+                 profile: Optional[ModelProfile] = None):
         print("Initializing GazeExtractor...")
         self.device = device
+        self.profile = profile or ModelProfile()
+        if self.profile.input_scale != 1.0:
+            raise ValueError(f"GazeExtractor does not support input_scale, got {self.profile.input_scale}")
+        self.track_aware = track_aware
+        self.change_threshold = change_threshold  # Head change score in [0, 1]
+        self.max_age = max_age                    # frames
+        self.smoothing = smoothing                # Weight of the new estimate in the EMA
+        self.track_states: Dict[int, _GazeTrackState] = {}
+        self._last_frame_id: Optional[int] = None
         self._load_model()
 
     def _load_model(self):
         """Placeholder for loading the Gaze Estimation model."""
         print("  - Placeholder: Loading ETH-XGaze model...")
         self.model = "(Mock Gaze Model)"
+        self.model = apply_precision(self.model, self.profile, self.device)
         print("Model loaded.")
 
-    def extract(self, pedestrian: Pedestrian, frame_data: FrameData) -> Pedestrian:
-        """
-        Crops the head region and runs gaze estimation.
-        """
-        if pedestrian.head_bbox is None:
-            return pedestrian
+    def reset(self):
+        """Clears all per-track state, e.g. before processing a new video."""
+        self.track_states.clear()
+        self._last_frame_id = None
 
-        x1, y1, x2, y2 = pedestrian.head_bbox.astype(int)
-        head_image = frame_data.image[y1:y2, x1:x2]
+    def _prune_tracks(self, frame_id: int):
+        """Drops tracks not seen for more than max_age frames (or seen in a 'future' frame)."""
+        expired = [track_id for track_id, state in self.track_states.items()
+                   if frame_id - state.last_frame_id > self.max_age or frame_id < state.last_frame_id]
+        for track_id in expired:
+            del self.track_states[track_id]
 
+    def _crop_head(self, head_bbox: np.ndarray, image: np.ndarray) -> Optional[np.ndarray]:
+        h, w = image.shape[:2]
+        x1, y1, x2, y2 = head_bbox.astype(int)
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, w), min(y2, h)
+        head_image = image[y1:y2, x1:x2]
         if head_image.size == 0:
-            return pedestrian
+            return None
+        return head_image
 
+    def _estimate_gaze(self, head_image: np.ndarray) -> np.ndarray:
+        """Runs the gaze model on a head crop and returns (pitch, yaw) in radians."""
         # Preprocess for model (e.g., resize to 224x224)
         # processed_head = cv2.resize(head_image, (224, 224))
-        
+
         # In a real implementation, you would run the model:
         # pitch, yaw = self.model.predict(processed_head)
-        
+
         # --- MOCK LOGIC START ---
         # Simulate a random gaze vector (pitch, yaw) in radians
         mock_pitch = np.random.uniform(-np.pi/4, np.pi/4)
         mock_yaw = np.random.uniform(-np.pi/2, np.pi/2)
-        pedestrian.gaze_vector = np.array([mock_pitch, mock_yaw])
+        return np.array([mock_pitch, mock_yaw])
         # --- MOCK LOGIC END ---
-        
-        return pedestrian
\ No newline at end of file
+
+    def _make_thumbnail(self, head_image: np.ndarray) -> np.ndarray:
+        if head_image.ndim == 3:
+            head_image = cv2.cvtColor(head_image, cv2.COLOR_BGR2GRAY)
+        thumbnail = cv2.resize(head_image, self.THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        return thumbnail.astype(np.float32) / 255.0
+
+    def _change_score(self, state: _GazeTrackState, head_bbox: np.ndarray, thumbnail: np.ndarray) -> float:
+        """
+        Combines head motion (bbox shift relative to head size) and appearance
+        change (mean absolute thumbnail difference) into a single score.
+        """
+        prev_size = max(state.head_bbox[2] - state.head_bbox[0], state.head_bbox[3] - state.head_bbox[1], 1.0)
+        prev_center = (state.head_bbox[:2] + state.head_bbox[2:]) / 2
+        center = (head_bbox[:2] + head_bbox[2:]) / 2
+        motion = np.linalg.norm(center - prev_center) / prev_size
+        appearance = float(np.mean(np.abs(thumbnail - state.head_crop)))
+        return float(max(motion, appearance))
+
+    def extract(self, pedestrian: Pedestrian, frame_data: FrameData) -> Pedestrian:
+        """
+        Crops the head region and runs gaze estimation.
+        """
+        if pedestrian.head_bbox is None:
+            return pedestrian
+
+        head_image = self._crop_head(pedestrian.head_bbox, frame_data.image)
+        if head_image is None:
+            return pedestrian
+
+        if not self.track_aware:
+            pedestrian.gaze_vector = self._estimate_gaze(head_image)
+            pedestrian.gaze_staleness = 0
+            return pedestrian
+
+        if frame_data.frame_id != self._last_frame_id:
+            self._prune_tracks(frame_data.frame_id)
+            self._last_frame_id = frame_data.frame_id
+
+        thumbnail = self._make_thumbnail(head_image)
+        head_bbox = pedestrian.head_bbox.astype(np.float32)
+        state = self.track_states.get(pedestrian.track_id)
+
+        if state is None:
+            # New (or long-lost) track: nothing to reuse or smooth against
+            state = _GazeTrackState(
+                head_crop=thumbnail,
+                head_bbox=head_bbox,
+                gaze_vector=self._estimate_gaze(head_image),
+                last_frame_id=frame_data.frame_id
+            )
+            self.track_states[pedestrian.track_id] = state
+        else:
+            state.staleness += frame_data.frame_id - state.last_frame_id
+            state.last_frame_id = frame_data.frame_id
+            state.change_score = self._change_score(state, head_bbox, thumbnail)
+
+            if state.change_score > self.change_threshold or state.staleness >= self.max_age:
+                new_gaze = self._estimate_gaze(head_image)
+                state.gaze_vector = self.smoothing * new_gaze + (1 - self.smoothing) * state.gaze_vector
+                state.head_crop = thumbnail
+                state.head_bbox = head_bbox
+                state.staleness = 0
+                state.change_score = 0.0
+
+        pedestrian.gaze_vector = state.gaze_vector.copy()
+        pedestrian.gaze_staleness = state.staleness
+        return pedestrian
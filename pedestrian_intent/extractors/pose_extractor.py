@@ -1,7 +1,9 @@
 # pedestrian_intent/extractors/pose_extractor.py
 import numpy as np
+from typing import Optional
 from .base_extractor import BaseExtractor
 from ..core.structures import Pedestrian, FrameData
+from ..core.profiles import ModelProfile, apply_precision
 
 class PoseExtractor(BaseExtractor):
     """
@@ -9,10 +11,14 @@ class PoseExtractor(BaseExtractor):
     
     NOTE: This is a high-level abstraction. A real implementation would use the
     MMPose Python API for inference.
+
+    An optional ModelProfile sets the input scale of the pedestrian crop
+    (keypoints are mapped back to frame coordinates) and the precision.
     """
-    def __init__(self, device: str = 'cuda'):
+    def __init__(self, device: str = 'cuda', profile: Optional[ModelProfile] = None):
         print("Initializing PoseExtractor...")
         self.device = device
+        self.profile = profile or ModelProfile()
         self._load_model()
 
     def _load_model(self):
@@ -21,26 +27,33 @@ class PoseExtractor(BaseExtractor):
         # from mmpose.apis import MMPoseInferencer
         # self.model = MMPoseInferencer('wholebody', device=self.device)
         self.model = "(Mock MMPose Model)"
+        self.model = apply_precision(self.model, self.profile, self.device)
         print("Model loaded.")
 
     def extract(self, pedestrian: Pedestrian, frame_data: FrameData) -> Pedestrian:
         """
         Crops the pedestrian from the full image and runs pose estimation.
         """
-        # In a real implementation, you would run the model:
+        x1, y1, x2, y2 = pedestrian.bbox
+        scale = self.profile.input_scale
+
+        # In a real implementation, you would run the model on the crop
+        # resized by `scale`:
         # result = self.model(image_crop)
         # keypoints = result['predictions'][0][0]['keypoints']
         # keypoint_scores = result['predictions'][0][0]['keypoint_scores']
         
         # --- MOCK LOGIC START ---
-        # Simulate finding 133 whole-body keypoints within the bbox
-        x1, y1, x2, y2 = pedestrian.bbox
-        mock_keypoints_x = np.random.uniform(x1, x2, 133)
-        mock_keypoints_y = np.random.uniform(y1, y2, 133)
+        # Simulate finding 133 whole-body keypoints within the (scaled) crop
+        mock_keypoints_x = np.random.uniform(0, (x2 - x1) * scale, 133)
+        mock_keypoints_y = np.random.uniform(0, (y2 - y1) * scale, 133)
         mock_scores = np.random.uniform(0.8, 1.0, 133)
-        
-        pedestrian.keypoints = np.stack([mock_keypoints_x, mock_keypoints_y, mock_scores], axis=1)
         # --- MOCK LOGIC END ---
+
+        # Map crop coordinates back to the full frame
+        keypoints_x = x1 + mock_keypoints_x / scale
+        keypoints_y = y1 + mock_keypoints_y / scale
+        pedestrian.keypoints = np.stack([keypoints_x, keypoints_y, mock_scores], axis=1)
         
         # Also extract head bbox from facial keypoints for the GazeExtractor
         # COCO WholeBody facial keypoints are typically indices 68-132 or similar
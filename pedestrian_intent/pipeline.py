@@ -1,8 +1,10 @@
 # pedestrian_intent/pipeline.py
 import cv2
 import json
+from typing import Union
 from tqdm import tqdm
 from .core.structures import FrameData, VideoData
+from .core.profiles import InferenceProfile, get_profile, set_num_threads
 from .detectors import GroundedSAMDetector
 from .extractors import PoseExtractor, GazeExtractor, TrajectoryExtractor
 from .predictors import RuleBasedPredictor
@@ -11,16 +13,27 @@ from .utils.visualization import Visualizer
 class PedestrianIntentPipeline:
     """
     The main orchestrator for the pedestrian intention prediction pipeline.
+
+    `profile` selects the inference profile (a name from INFERENCE_PROFILES,
+    e.g. 'cpu_edge', or an InferenceProfile) used to build the models.
+    `gaze_track_aware` enables the track-aware GazeExtractor mode, which reuses
+    a smoothed gaze estimate per track between model runs. It is off by default,
+    so gaze is estimated on every frame.
     """
-    def __init__(self, config_path: str = "pedestrian_intent/assets/class_definitions.json"):
+    def __init__(self, config_path: str = "pedestrian_intent/assets/class_definitions.json",
+                 profile: Union[str, InferenceProfile] = "default", gaze_track_aware: bool = False):
         print("Initializing Pedestrian Intent Pipeline...")
-        self.detector = GroundedSAMDetector()
+        self.profile = get_profile(profile)
+        print(f"  - Using inference profile: {self.profile.name} ({self.profile.device})")
+        set_num_threads(self.profile.num_threads)
+        self.detector = GroundedSAMDetector(device=self.profile.device, profile=self.profile.detector)
         
         self.video_data = VideoData() # Create a data store for the whole video
         
         self.extractors = {
-            "pose": PoseExtractor(),
-            "gaze": GazeExtractor(),
+            "pose": PoseExtractor(device=self.profile.device, profile=self.profile.pose),
+            "gaze": GazeExtractor(device=self.profile.device, track_aware=gaze_track_aware,
+                                  profile=self.profile.gaze),
             "trajectory": TrajectoryExtractor(self.video_data)
         }
         self.predictor = RuleBasedPredictor()
@@ -52,6 +65,10 @@ class PedestrianIntentPipeline:
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
         out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
         
+        # Start every video from a clean state: frame ids restart at 0
+        self.video_data.pedestrians.clear()
+        self.extractors["gaze"].reset()
+
         frame_id = 0
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
@@ -0,0 +1,190 @@
+# pedestrian_intent/utils/benchmark.py
+import io
+import time
+import contextlib
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union
+from ..core.structures import FrameData
+from ..core.profiles import InferenceProfile, get_profile, set_num_threads, INFERENCE_PROFILES
+from ..detectors import GroundedSAMDetector
+from ..extractors import PoseExtractor, GazeExtractor
+
+def _mask_iou(a: np.ndarray, b: np.ndarray) -> float:
+    union = np.logical_or(a, b).sum()
+    if union == 0:
+        return 1.0
+    return float(np.logical_and(a, b).sum() / union)
+
+
+def _simulate_input_grid(pedestrians: List, scale: float):
+    """
+    Snaps keypoints to pixel centres of the scaled pose input, the resolution
+    loss a real model would have. The placeholder pose model has no such loss.
+    """
+    for ped in pedestrians:
+        if ped.keypoints is None:
+            continue
+        origin = ped.bbox[:2].astype(float)
+        grid = np.floor((ped.keypoints[:, :2] - origin) * scale) + 0.5
+        ped.keypoints[:, :2] = origin + grid / scale
+
+
+def _get_num_threads() -> tuple:
+    """Returns the current (OpenCV, PyTorch) thread counts; PyTorch is None if not installed."""
+    try:
+        import torch
+        torch_threads = torch.get_num_threads()
+    except ImportError:
+        torch_threads = None
+    return cv2.getNumThreads(), torch_threads
+
+
+def _restore_num_threads(cv2_threads: int, torch_threads: Optional[int]):
+    cv2.setNumThreads(cv2_threads)
+    if torch_threads is not None:
+        import torch
+        torch.set_num_threads(torch_threads)
+
+
+def _run_profile(profile: InferenceProfile, frames: List[np.ndarray], prompts: List[str], seed: int) -> Dict:
+    """Runs detection, pose and gaze on every frame and records timings and outputs."""
+    # Profiles change the process-wide thread count and the mocks are seeded through
+    # the global NumPy RNG; restore both so the caller's state is left untouched
+    saved_threads = _get_num_threads()
+    saved_rng_state = np.random.get_state()
+    try:
+        set_num_threads(profile.num_threads)
+        with contextlib.redirect_stdout(io.StringIO()):
+            detector = GroundedSAMDetector(device=profile.device, profile=profile.detector)
+            pose_extractor = PoseExtractor(device=profile.device, profile=profile.pose)
+            gaze_extractor = GazeExtractor(device=profile.device, profile=profile.gaze)
+
+        timings = {"detector": [], "pose": [], "gaze": []}
+        outputs = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for frame_id, image in enumerate(frames):
+                # Seed every model call so the mock models are comparable across profiles
+                np.random.seed(seed + frame_id)
+                start = time.perf_counter()
+                pedestrians, scene_elements = detector.process_frame(image, prompts)
+                timings["detector"].append(time.perf_counter() - start)
+                frame_data = FrameData(frame_id, image, pedestrians, scene_elements)
+
+                np.random.seed(seed + frame_id)
+                start = time.perf_counter()
+                pedestrians = [pose_extractor.extract(p, frame_data) for p in pedestrians]
+                timings["pose"].append(time.perf_counter() - start)
+                _simulate_input_grid(pedestrians, profile.pose.input_scale)
+
+                np.random.seed(seed + frame_id)
+                start = time.perf_counter()
+                pedestrians = [gaze_extractor.extract(p, frame_data) for p in pedestrians]
+                timings["gaze"].append(time.perf_counter() - start)
+
+                outputs.append((pedestrians, scene_elements))
+    finally:
+        _restore_num_threads(*saved_threads)
+        np.random.set_state(saved_rng_state)
+
+    models = [detector.grounding_dino, detector.sam2_tracker, pose_extractor.model, gaze_extractor.model]
+    return {"timings": timings, "outputs": outputs, "mock_models": any(isinstance(m, str) for m in models)}
+
+
+def _compare(outputs: List, reference: List) -> Dict[str, float]:
+    """Accuracy of a profile's outputs against the reference profile's outputs."""
+    ious, keypoint_errors, gaze_errors = [], [], []
+    for (peds, elements), (ref_peds, ref_elements) in zip(outputs, reference):
+        for obj, ref in zip(peds + elements, ref_peds + ref_elements):
+            ious.append(_mask_iou(obj.mask, ref.mask))
+        for ped, ref in zip(peds, ref_peds):
+            if ped.keypoints is not None and ref.keypoints is not None:
+                keypoint_errors.append(np.mean(np.linalg.norm(ped.keypoints[:, :2] - ref.keypoints[:, :2], axis=1)))
+            if ped.gaze_vector is not None and ref.gaze_vector is not None:
+                gaze_errors.append(np.degrees(np.linalg.norm(ped.gaze_vector - ref.gaze_vector)))
+    return {
+        "mask_iou": float(np.mean(ious)) if ious else float("nan"),
+        "keypoint_error_px": float(np.mean(keypoint_errors)) if keypoint_errors else float("nan"),
+        "gaze_error_deg": float(np.mean(gaze_errors)) if gaze_errors else float("nan"),
+    }
+
+
+def benchmark_profiles(profiles: Optional[Sequence[Union[str, InferenceProfile]]] = None,
+                       num_frames: int = 30, frame_size: tuple = (720, 1280),
+                       prompts: Optional[List[str]] = None, seed: int = 0) -> List[Dict]:
+    """
+    Benchmarks inference profiles on synthetic frames.
+
+    The first profile is the accuracy reference; every profile reports its mean
+    per-frame latency per model and its accuracy against that reference. With
+    the placeholder models only the input-resolution effects are simulated
+    (detections on the scaled frame, keypoints snapped to the scaled pose input
+    grid by the benchmark); format_report lists what the numbers do not cover.
+
+    Args:
+        profiles: Profile names or InferenceProfile objects. Defaults to all INFERENCE_PROFILES.
+        num_frames: Number of synthetic frames to process.
+        frame_size: (height, width) of the synthetic frames.
+        prompts: Detection prompts, defaults to ["pedestrian", "car"].
+        seed: Seed for the synthetic frames and the mock models.
+
+    Returns:
+        A list with one result dict per profile.
+    """
+    profiles = [get_profile(p) for p in (profiles or list(INFERENCE_PROFILES))]
+    prompts = prompts or ["pedestrian", "car"]
+    rng = np.random.default_rng(seed)
+    frames = [rng.integers(0, 256, (*frame_size, 3), dtype=np.uint8) for _ in range(num_frames)]
+
+    runs = [_run_profile(profile, frames, prompts, seed) for profile in profiles]
+    reference = runs[0]["outputs"]
+
+    results = []
+    for profile, run in zip(profiles, runs):
+        latency = {name: 1000.0 * float(np.mean(t)) for name, t in run["timings"].items()}
+        result = {
+            "profile": profile.name,
+            "device": profile.device,
+            "detector_ms": latency["detector"],
+            "pose_ms": latency["pose"],
+            "gaze_ms": latency["gaze"],
+            "total_ms": sum(latency.values()),
+            "mock_models": run["mock_models"],
+        }
+        result.update(_compare(run["outputs"], reference))
+        results.append(result)
+
+    reference_ms = results[0]["total_ms"]
+    for result in results:
+        result["speedup"] = reference_ms / result["total_ms"] if result["total_ms"] > 0 else float("nan")
+    return results
+
+
+def format_report(results: List[Dict]) -> str:
+    """Formats benchmark_profiles() results as a Markdown accuracy-vs-speed table."""
+    columns = [
+        ("profile", "Profile", "{}"), ("device", "Device (configured)", "{}"),
+        ("detector_ms", "Detector (ms)", "{:.2f}"), ("pose_ms", "Pose (ms)", "{:.2f}"),
+        ("gaze_ms", "Gaze (ms)", "{:.2f}"), ("total_ms", "Total (ms)", "{:.2f}"),
+        ("speedup", "Speedup", "{:.2f}x"), ("mask_iou", "Mask IoU", "{:.3f}"),
+        ("keypoint_error_px", "Keypoint err (px)", "{:.2f}"), ("gaze_error_deg", "Gaze err (deg)", "{:.2f}"),
+    ]
+    lines = [
+        "| " + " | ".join(title for _, title, _ in columns) + " |",
+        "|" + "|".join("---" for _ in columns) + "|",
+    ]
+    for result in results:
+        lines.append("| " + " | ".join(fmt.format(result[key]) for key, _, fmt in columns) + " |")
+
+    if any(result.get("mock_models") for result in results):
+        lines += [
+            "",
+            "NOTE: placeholder models were used, so these numbers are not representative:",
+            "- Nothing runs on the configured device; the placeholders run on the CPU.",
+            "- Latency covers only pre/post-processing (resizing, mask upscaling, centroids), not model inference;",
+            "  reduced input scales add work here instead of saving it.",
+            "- Mask IoU only reflects detection on the scaled input grid; keypoint error is simulated by the",
+            "  benchmark snapping keypoints to the scaled pose input grid.",
+            "- Gaze error and precision (fp16/int8) effects are not simulated and read 0 by construction.",
+        ]
+    return "\n".join(lines)
@@ -0,0 +1,84 @@
+# tests/test_gaze_extractor.py
+import numpy as np
+import pytest
+from pedestrian_intent.core.structures import FrameData, Pedestrian
+from pedestrian_intent.extractors import GazeExtractor
+
+HEAD_BBOX = np.array([100, 50, 140, 90])
+
+
+class CountingGazeExtractor(GazeExtractor):
+    """Returns a deterministic gaze per call and records the frames the model ran on."""
+    def __init__(self, **kwargs):
+        super().__init__(device='cpu', track_aware=True, **kwargs)
+        self.model_calls = []
+        self._frame_id = None
+
+    def _estimate_gaze(self, head_image):
+        self.model_calls.append(self._frame_id)
+        return np.array([0.0, 1.0]) * len(self.model_calls)
+
+    def run(self, frame_id, image, head_bbox=HEAD_BBOX, track_id=0):
+        self._frame_id = frame_id
+        h, w = image.shape[:2]
+        mask = np.zeros((h, w), dtype=bool)
+        pedestrian = Pedestrian(track_id=track_id, label="pedestrian", bbox=np.array([80, 40, 160, 200]),
+                                mask=mask, confidence=1.0, head_bbox=head_bbox)
+        return self.extract(pedestrian, FrameData(frame_id, image, [pedestrian], []))
+
+
+@pytest.fixture
+def image():
+    return np.full((240, 320, 3), 128, dtype=np.uint8)
+
+
+def test_reuses_estimate_until_max_age(image):
+    extractor = CountingGazeExtractor(max_age=5)
+    staleness = [extractor.run(i, image).gaze_staleness for i in range(12)]
+
+    assert extractor.model_calls == [0, 5, 10]
+    assert staleness == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4, 0, 1]
+
+
+def test_reruns_on_head_change_and_smooths(image):
+    extractor = CountingGazeExtractor(max_age=100, smoothing=0.5)
+    extractor.run(0, image)
+    extractor.run(1, image)
+
+    changed = image.copy()
+    changed[50:90, 100:140] = 255
+    ped = extractor.run(2, changed)
+
+    assert extractor.model_calls == [0, 2]
+    assert ped.gaze_staleness == 0
+    # EMA of the first estimate (0, 1) and the second (0, 2)
+    np.testing.assert_allclose(ped.gaze_vector, [0.0, 1.5])
+
+
+def test_reruns_on_head_motion(image):
+    extractor = CountingGazeExtractor(max_age=100)
+    extractor.run(0, image)
+    extractor.run(1, image, head_bbox=HEAD_BBOX + np.array([20, 0, 20, 0]))
+
+    assert extractor.model_calls == [0, 1]
+
+
+def test_restarted_frame_ids_start_fresh(image):
+    extractor = CountingGazeExtractor(max_age=10)
+    for i in range(25):
+        extractor.run(i, image)
+    calls_before = len(extractor.model_calls)
+
+    staleness = [extractor.run(i, image).gaze_staleness for i in range(12)]
+
+    assert extractor.model_calls[calls_before:] == [0, 10]
+    assert min(staleness) >= 0
+
+
+def test_prunes_lost_tracks(image):
+    extractor = CountingGazeExtractor(max_age=3)
+    extractor.run(0, image, track_id=1)
+    for i in range(1, 6):
+        extractor.run(i, image, track_id=2)
+
+    assert set(extractor.track_states) == {2}
@@ -0,0 +1,46 @@
+# tests/test_grounded_sam_detector.py
+import numpy as np
+import pytest
+from pedestrian_intent.core.profiles import ModelProfile
+from pedestrian_intent.detectors import GroundedSAMDetector
+
+PROMPTS = ["pedestrian", "car"]
+
+
+def _detect(image, scale):
+    detector = GroundedSAMDetector(device='cpu', profile=ModelProfile(input_scale=scale))
+    pedestrians, scene_elements = detector.process_frame(image, PROMPTS)
+    return pedestrians + scene_elements
+
+
+@pytest.mark.parametrize("frame_size", [(720, 1280), (721, 1283), (99, 157)])
+@pytest.mark.parametrize("scale", [0.75, 0.5, 0.37])
+def test_downscaled_detections_match_the_full_resolution_api(frame_size, scale):
+    image = np.zeros((*frame_size, 3), dtype=np.uint8)
+    reference = _detect(image, 1.0)
+    scaled = _detect(image, scale)
+
+    assert [o.label for o in scaled] == [o.label for o in reference]
+    for obj, ref in zip(scaled, reference):
+        assert obj.bbox.dtype == ref.bbox.dtype
+        assert obj.mask.shape == frame_size
+        assert obj.mask.dtype == bool
+        # Boxes land within one scaled input pixel of the full-resolution ones
+        assert np.all(np.abs(obj.bbox - ref.bbox) <= np.ceil(1 / scale))
+        iou = np.logical_and(obj.mask, ref.mask).sum() / np.logical_or(obj.mask, ref.mask).sum()
+        assert iou > 0.8
+
+
+def test_to_frame_coordinates_rounds_int_boxes_and_upscales_the_mask_region():
+    detector = GroundedSAMDetector(device='cpu', profile=ModelProfile(input_scale=0.5))
+    mask = np.zeros((50, 80), dtype=bool)
+    mask[10:20, 30:40] = True
+    result = {"bbox": np.array([30, 10, 40, 20]), "mask": mask}
+
+    result = detector._to_frame_coordinates(result, (50, 80), (101, 161))
+
+    assert result["bbox"].dtype == np.array([0]).dtype
+    np.testing.assert_array_equal(result["bbox"], [60, 20, 80, 40])
+    assert result["mask"].shape == (101, 161)
+    rows, cols = np.where(result["mask"])
+    assert (rows.min(), rows.max() + 1, cols.min(), cols.max() + 1) == (20, 40, 60, 80)
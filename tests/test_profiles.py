@@ -0,0 +1,75 @@
+# tests/test_profiles.py
+import numpy as np
+import pytest
+from pedestrian_intent.core.profiles import ModelProfile, InferenceProfile, INFERENCE_PROFILES, get_profile
+from pedestrian_intent.core.structures import FrameData, Pedestrian
+from pedestrian_intent.extractors import GazeExtractor, PoseExtractor
+from pedestrian_intent.utils.benchmark import benchmark_profiles, format_report
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"input_scale": 0.0},
+    {"input_scale": 1.5},
+    {"precision": "int4"},
+    {"precision": "onnx"},
+])
+def test_model_profile_rejects_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        ModelProfile(**kwargs)
+
+
+def test_get_profile_resolves_names_none_and_instances():
+    assert get_profile() is INFERENCE_PROFILES["default"]
+    assert get_profile(None) is INFERENCE_PROFILES["default"]
+    assert get_profile("cpu_edge") is INFERENCE_PROFILES["cpu_edge"]
+
+    custom = InferenceProfile(name="custom", device="cpu")
+    assert get_profile(custom) is custom
+
+    with pytest.raises(ValueError, match="Unknown inference profile"):
+        get_profile("does_not_exist")
+
+
+def test_gaze_extractor_rejects_input_scale():
+    with pytest.raises(ValueError):
+        GazeExtractor(device='cpu', profile=ModelProfile(input_scale=0.5))
+
+
+def _run_pose(scale):
+    image = np.zeros((240, 320, 3), dtype=np.uint8)
+    pedestrian = Pedestrian(track_id=0, label="pedestrian", bbox=np.array([10, 20, 110, 220]),
+                            mask=np.zeros((240, 320), dtype=bool), confidence=1.0)
+    extractor = PoseExtractor(device='cpu', profile=ModelProfile(input_scale=scale))
+    np.random.seed(0)
+    return extractor.extract(pedestrian, FrameData(0, image, [pedestrian], []))
+
+
+def test_pose_keypoints_are_mapped_back_to_the_frame_bbox():
+    reference = _run_pose(1.0)
+    scaled = _run_pose(0.5)
+
+    x, y = scaled.keypoints[:, 0], scaled.keypoints[:, 1]
+    assert np.all((x >= 10) & (x <= 110))
+    assert np.all((y >= 20) & (y <= 220))
+    np.testing.assert_allclose(scaled.keypoints, reference.keypoints)
+
+
+def test_benchmark_report_compares_profiles_against_the_reference():
+    np.random.seed(123)
+    expected_next = np.random.rand()
+    np.random.seed(123)
+
+    results = benchmark_profiles(["default", "cpu_edge"], num_frames=2, frame_size=(120, 160))
+
+    assert np.random.rand() == expected_next  # the caller's RNG state is restored
+    assert [r["profile"] for r in results] == ["default", "cpu_edge"]
+    assert results[0]["speedup"] == pytest.approx(1.0)
+    assert results[0]["keypoint_error_px"] == 0.0
+    assert results[1]["keypoint_error_px"] > 0.0
+
+    report = format_report(results)
+    lines = report.splitlines()
+    assert lines[0].startswith("| Profile | Device (configured) |")
+    assert lines[2].startswith("| default | cuda |")
+    assert lines[3].startswith("| cpu_edge | cpu |")
+    assert "placeholder models were used" in report